@@ -47,23 +47,17 @@ def get_script_location():
     return None
 
 
+# Shell config file by shell executable name
+_SHELL_RC = {'zsh': '.zshrc', 'bash': '.bashrc'}
+
+# Default to .zshrc on macOS, .bashrc on Linux
+_DEFAULT_RC = '.zshrc' if sys.platform == 'darwin' else '.bashrc'
+
+
 def get_shell_config_file():
     """Get the appropriate shell config file for the current user."""
-    home = Path.home()
-    
-    # Check which shell is being used
-    shell = os.environ.get('SHELL', '')
-    
-    if 'zsh' in shell:
-        return home / '.zshrc'
-    elif 'bash' in shell:
-        return home / '.bashrc'
-    else:
-        # Default to .zshrc on macOS, .bashrc on Linux
-        if sys.platform == 'darwin':
-            return home / '.zshrc'
-        else:
-            return home / '.bashrc'
+    shell_name = Path(os.environ.get('SHELL', '')).name
+    return Path.home() / _SHELL_RC.get(shell_name, _DEFAULT_RC)
 
 
 def add_to_path(script_dir):
@@ -74,8 +68,8 @@ def add_to_path(script_dir):
     # Check if the line already exists
     if config_file.exists():
         with open(config_file, 'r') as f:
-            content = f.read()
-            if export_line in content:
+            # Stop reading at the first matching line
+            if any(export_line in line for line in f):
                 print(f"✅ PATH already configured in {config_file}")
                 return True
     
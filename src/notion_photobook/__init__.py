@@ -8,13 +8,23 @@ __version__ = "0.1.0"
 __author__ = "Notion Photobook Team"
 __email__ = "contact@notion-photobook.dev"
 
-from .core import NotionPhotobookGenerator
-from .config import PhotobookConfig, Layout, PaperSize
+from typing import Any
+
+from .config import PhotobookConfig, Layout, PaperSize, ColumnKind
 
 __all__ = [
     "NotionPhotobookGenerator",
     "PhotobookConfig", 
     "Layout",
     "PaperSize",
+    "ColumnKind",
     "__version__",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the generator lazily so the CLI can start without PIL/ReportLab."""
+    if name == "NotionPhotobookGenerator":
+        from .core import NotionPhotobookGenerator
+        return NotionPhotobookGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,21 +4,26 @@ Command-line interface for Notion Photobook Generator.
 Provides a user-friendly CLI for generating photobooks from Notion exports.
 """
 
+import logging
 import os
+import re
+import shutil
+import site
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
-from rich.text import Text
 
-from .core import NotionPhotobookGenerator
+# Only the lightweight config module is imported eagerly; the generator
+# (and with it PIL/ReportLab) is imported inside the commands that need it
 from .config import PhotobookConfig, Layout, PaperSize
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 # Create Typer app
 app = typer.Typer(
     name="photobookgen",
@@ -26,65 +31,119 @@ app = typer.Typer(
     add_completion=False,
 )
 
-# Rich console for pretty output
-console = Console()
+SCRIPT_NAME = "photobookgen"
+
+# Set to skip the PATH check, e.g. `export PHOTOBOOKGEN_PATH_OK=1` in a batch script
+PATH_OK_ENV = "PHOTOBOOKGEN_PATH_OK"
+
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Shared Rich console, created on first print so silent commands skip terminal probing."""
+    from rich.console import Console
+    return Console()
+
+
+@lru_cache(maxsize=1)
+def _which_script() -> Optional[str]:
+    """Look the script up on PATH once per process."""
+    return shutil.which(SCRIPT_NAME)
+
+
+@lru_cache(maxsize=1)
+def _resolve_script_dir() -> Optional[Path]:
+    """Locate the directory holding the installed script, probing each candidate once."""
+    script_path = _which_script()
+    if script_path:
+        return Path(script_path).parent
+    
+    candidates = []
+    # Virtual environment bin first, then the user site-packages bin
+    if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
+        candidates.append(Path(sys.prefix) / "bin")
+    user_site = site.getusersitepackages()
+    if user_site:
+        candidates.append(Path(user_site).parent / "bin")
+    
+    for script_dir in candidates:
+        if (script_dir / SCRIPT_NAME).exists():
+            return script_dir
+    return None
 
 
+@lru_cache(maxsize=1)
 def check_path_setup():
-    """Check if the script is properly accessible and provide helpful guidance."""
-    script_name = "photobookgen"
+    """Check if the script is properly accessible and provide helpful guidance (once per process)."""
+    # A previous check in this process (or an exported shell variable) already confirmed PATH
+    if os.environ.get(PATH_OK_ENV):
+        return
     
-    # Check if we can find the script in PATH
-    import shutil
-    if shutil.which(script_name) is None:
-        # Try to find where pip3 installed it
-        import site
-        user_site = site.getusersitepackages()
-        if user_site:
-            script_dir = Path(user_site).parent / "bin"
-            if (script_dir / script_name).exists():
-                console.print(f"\n⚠️  [yellow]Note:[/yellow] The '{script_name}' command is installed but not in your PATH.")
-                console.print(f"   Script location: {script_dir}")
-                console.print(f"   To add to PATH, run: [bold]export PATH=\"{script_dir}:$PATH\"[/bold]")
-                console.print(f"   Or add to your shell config file (~/.zshrc, ~/.bashrc, etc.)")
-                console.print(f"   Then restart your terminal or run: [bold]source ~/.zshrc[/bold]\n")
+    # Nothing to report when the script is already reachable from PATH
+    if _which_script() is not None:
+        os.environ[PATH_OK_ENV] = "1"
+        return
+    
+    script_dir = _resolve_script_dir()
+    if script_dir:
+        _console().print(f"\n⚠️  [yellow]Note:[/yellow] The '{SCRIPT_NAME}' command is installed but not in your PATH.")
+        _console().print(f"   Script location: {script_dir}")
+        _console().print(f"   To add to PATH, run: [bold]export PATH=\"{script_dir}:$PATH\"[/bold]")
+        _console().print(f"   Or add to your shell config file (~/.zshrc, ~/.bashrc, etc.)")
+        _console().print(f"   Then restart your terminal or run: [bold]source ~/.zshrc[/bold]\n")
 
 
 def validate_input_folder(input_folder: Path) -> None:
     """Validate that input folder exists and contains HTML files."""
-    if not input_folder.exists():
+    # A single directory read answers all three questions: scandir fails on a
+    # missing path or a non-directory, and the dirent types tell us which
+    # entries are HTML files without stat'ing each one
+    try:
+        with os.scandir(input_folder) as it:
+            has_html = any(
+                entry.name.endswith(".html") and entry.is_file() for entry in it
+            )
+    except FileNotFoundError:
         raise typer.BadParameter(f"Input folder does not exist: {input_folder}")
-    
-    if not input_folder.is_dir():
+    except NotADirectoryError:
         raise typer.BadParameter(f"Input path is not a directory: {input_folder}")
     
-    html_files = list(input_folder.glob("*.html"))
-    if not html_files:
+    if not has_html:
         raise typer.BadParameter(f"No HTML files found in: {input_folder}")
 
 
-def validate_img_dir(img_dir: Optional[Path]) -> Optional[Path]:
-    """Validate image directory if provided."""
-    if img_dir is None:
-        return None
-    
-    if not img_dir.exists():
-        raise typer.BadParameter(f"Image directory does not exist: {img_dir}")
-    
-    if not img_dir.is_dir():
-        raise typer.BadParameter(f"Image path is not a directory: {img_dir}")
-    
-    return img_dir
-
-
 def parse_date(date_str: str) -> datetime:
     """Parse date string in format YYYY-MM-DD."""
+    # Check the shape up front, then build the datetime without going through strptime
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d")
+        if not _DATE_RE.fullmatch(date_str):
+            raise ValueError(date_str)
+        year, month, day = date_str.split('-', 2)
+        return datetime(int(year), int(month), int(day))
     except ValueError:
         raise typer.BadParameter(f"Invalid date format: {date_str}. Use YYYY-MM-DD")
 
 
+def configure_logging(verbose: bool) -> None:
+    """
+    Show the library's progress messages (logged at INFO level) on stderr.
+    
+    Only the notion_photobook logger is configured, so third-party libraries
+    keep their own logging setup.
+    
+    Args:
+        verbose: Show step-by-step progress; otherwise only warnings and errors
+    """
+    logger = logging.getLogger("notion_photobook")
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(logging.INFO if verbose else logging.WARNING)
+
+
 @app.command()
 def generate(
     input_folder: Path = typer.Argument(
@@ -171,13 +230,19 @@ def generate(
     Example:
         photobookgen ./my_notion_export ./book.pdf --layout portrait --size A4
     """
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    from .core import NotionPhotobookGenerator
+    
+    configure_logging(verbose)
+    
     try:
         # Check PATH setup on first run
         check_path_setup()
         
-        # Validate inputs
+        # Validate inputs (Typer already checked that img_dir is an existing directory)
         validate_input_folder(input_folder)
-        img_dir = validate_img_dir(img_dir)
         
         # Parse max date if provided
         max_date_obj = None
@@ -196,7 +261,7 @@ def generate(
         
         # Show configuration
         if verbose:
-            console.print(Panel(
+            _console().print(Panel(
                 f"[bold]Configuration:[/bold]\n"
                 f"Layout: {layout.value}\n"
                 f"Paper size: {paper_size.value}\n"
@@ -215,7 +280,7 @@ def generate(
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=_console(),
             transient=True,
         ) as progress:
             task = progress.add_task("Generating photobook...", total=None)
@@ -229,13 +294,13 @@ def generate(
             )
         
         # Success message
-        console.print(f"\n✅ [bold green]Photobook generated successfully![/bold green]")
-        console.print(f"📄 Output: {output_path}")
+        _console().print(f"\n✅ [bold green]Photobook generated successfully![/bold green]")
+        _console().print(f"📄 Output: {output_path}")
         
     except Exception as e:
-        console.print(f"\n❌ [bold red]Error:[/bold red] {e}")
+        _console().print(f"\n❌ [bold red]Error:[/bold red] {e}")
         if verbose:
-            console.print_exception()
+            _console().print_exception()
         sys.exit(1)
 
 
@@ -267,11 +332,16 @@ def demo(
     This creates a photobook using sample entries to demonstrate the tool's capabilities.
     Note: You'll need to add some sample images to see the full effect.
     """
+    from .core import NotionPhotobookGenerator
+    
+    # demo has no --verbose flag and always reports progress
+    configure_logging(verbose=True)
+    
     try:
         # Check PATH setup on first run
         check_path_setup()
         
-        console.print("🎭 [bold]Generating demo photobook...[/bold]")
+        _console().print("🎭 [bold]Generating demo photobook...[/bold]")
         
         # Create configuration
         config = PhotobookConfig(
@@ -293,13 +363,13 @@ def demo(
         # Generate photobook from demo data
         generator.generate_from_json(demo_json, output_path, img_dir)
         
-        console.print(f"\n✅ [bold green]Demo photobook generated![/bold green]")
-        console.print(f"📄 Output: {output_path}")
-        console.print(f"📝 Demo data: {demo_json}")
-        console.print(f"🖼️  Add some images to {img_dir} to see the full effect")
+        _console().print(f"\n✅ [bold green]Demo photobook generated![/bold green]")
+        _console().print(f"📄 Output: {output_path}")
+        _console().print(f"📝 Demo data: {demo_json}")
+        _console().print(f"🖼️  Add some images to {img_dir} to see the full effect")
         
     except Exception as e:
-        console.print(f"\n❌ [bold red]Error:[/bold red] {e}")
+        _console().print(f"\n❌ [bold red]Error:[/bold red] {e}")
         sys.exit(1)
 
 
@@ -336,6 +406,11 @@ def parse(
     
     This is useful for inspecting the parsed data or generating JSON for later use.
     """
+    from .core import NotionPhotobookGenerator
+    
+    # parse has no --verbose flag and always reports progress
+    configure_logging(verbose=True)
+    
     try:
         # Check PATH setup on first run
         check_path_setup()
@@ -359,14 +434,14 @@ def parse(
             max_date=max_date_obj,
         )
         
-        console.print(f"\n✅ [bold green]Parsed successfully![/bold green]")
-        console.print(f"📝 Found {len(entries)} entries")
-        console.print(f"📄 Output: {output_json}")
+        _console().print(f"\n✅ [bold green]Parsed successfully![/bold green]")
+        _console().print(f"📝 Found {len(entries)} entries")
+        _console().print(f"📄 Output: {output_json}")
         if test_json:
-            console.print(f"🧪 Test data: {test_json}")
+            _console().print(f"🧪 Test data: {test_json}")
         
     except Exception as e:
-        console.print(f"\n❌ [bold red]Error:[/bold red] {e}")
+        _console().print(f"\n❌ [bold red]Error:[/bold red] {e}")
         sys.exit(1)
 
 
@@ -375,64 +450,36 @@ def version() -> None:
     """Show version information."""
     from . import __version__
     
-    console.print(f"📚 [bold]Notion Photobook Generator[/bold] v{__version__}")
-    console.print("Convert Notion HTML exports into beautiful print-ready photobooks")
+    _console().print(f"📚 [bold]Notion Photobook Generator[/bold] v{__version__}")
+    _console().print("Convert Notion HTML exports into beautiful print-ready photobooks")
 
 
 @app.command()
 def setup() -> None:
     """Show setup instructions for PATH configuration."""
-    console.print("[bold]🔧 Setup Instructions[/bold]\n")
-    
-    # Try to find the script location
-    import site
-    import sys
+    _console().print("[bold]🔧 Setup Instructions[/bold]\n")
     
-    # Check virtual environment first
-    if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
-        script_dir = Path(sys.prefix) / "bin"
-        if (script_dir / "photobookgen").exists():
-            console.print(f"📍 Script location: [bold]{script_dir}[/bold]\n")
-            
-            console.print("To add to your PATH, choose one of these options:\n")
-            
-            console.print("1️⃣ [bold]Temporary (current session only):[/bold]")
-            console.print(f"   [code]export PATH=\"{script_dir}:$PATH\"[/code]\n")
-            
-            console.print("2️⃣ [bold]Permanent (recommended):[/bold]")
-            console.print("   Add this line to your shell config file:")
-            console.print(f"   [code]export PATH=\"{script_dir}:$PATH\"[/code]")
-            console.print("   Then restart your terminal or run: [code]source ~/.zshrc[/code]\n")
-            
-            console.print("3️⃣ [bold]Alternative:[/bold]")
-            console.print("   Run the tool directly:")
-            console.print(f"   [code]{script_dir}/photobookgen --help[/code]\n")
-            return
-    
-    # Check user site packages
-    user_site = site.getusersitepackages()
-    if user_site:
-        script_dir = Path(user_site).parent / "bin"
-        if (script_dir / "photobookgen").exists():
-            console.print(f"📍 Script location: [bold]{script_dir}[/bold]\n")
-            
-            console.print("To add to your PATH, choose one of these options:\n")
-            
-            console.print("1️⃣ [bold]Temporary (current session only):[/bold]")
-            console.print(f"   [code]export PATH=\"{script_dir}:$PATH\"[/code]\n")
-            
-            console.print("2️⃣ [bold]Permanent (recommended):[/bold]")
-            console.print("   Add this line to your shell config file:")
-            console.print(f"   [code]export PATH=\"{script_dir}:$PATH\"[/code]")
-            console.print("   Then restart your terminal or run: [code]source ~/.zshrc[/code]\n")
-            
-            console.print("3️⃣ [bold]Alternative:[/bold]")
-            console.print("   Run the tool directly:")
-            console.print(f"   [code]{script_dir}/photobookgen --help[/code]\n")
-            return
+    script_dir = _resolve_script_dir()
+    if script_dir:
+        _console().print(f"📍 Script location: [bold]{script_dir}[/bold]\n")
+        
+        _console().print("To add to your PATH, choose one of these options:\n")
+        
+        _console().print("1️⃣ [bold]Temporary (current session only):[/bold]")
+        _console().print(f"   [code]export PATH=\"{script_dir}:$PATH\"[/code]\n")
+        
+        _console().print("2️⃣ [bold]Permanent (recommended):[/bold]")
+        _console().print("   Add this line to your shell config file:")
+        _console().print(f"   [code]export PATH=\"{script_dir}:$PATH\"[/code]")
+        _console().print("   Then restart your terminal or run: [code]source ~/.zshrc[/code]\n")
+        
+        _console().print("3️⃣ [bold]Alternative:[/bold]")
+        _console().print("   Run the tool directly:")
+        _console().print(f"   [code]{script_dir}/photobookgen --help[/code]\n")
+        return
     
-    console.print("❌ Could not find the photobookgen script.")
-    console.print("   Try reinstalling the package.")
+    _console().print("❌ Could not find the photobookgen script.")
+    _console().print("   Try reinstalling the package.")
 
 
 def main():
@@ -2,9 +2,12 @@
 Configuration and settings for the Notion Photobook Generator.
 """
 
-from dataclasses import dataclass
-from enum import Enum
-from typing import Optional, Dict, Any
+import sys
+from dataclasses import dataclass, fields
+from enum import Enum, IntEnum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple
 from pathlib import Path
 
 
@@ -23,9 +26,41 @@ class PaperSize(Enum):
     LEGAL = "legal"
 
 
-@dataclass
+class ColumnKind(IntEnum):
+    """Entry columns, in the order of PhotobookConfig.columns."""
+    TITLE = 0
+    DATE = 1
+    IMAGE = 2
+    TEXT = 3
+
+
+# Enum members by value (members map to themselves), so from_dict skips the
+# Enum.__call__ machinery
+_LAYOUT_BY_VALUE: Dict[Any, Layout] = {key: m for m in Layout for key in (m.value, m)}
+_PAPER_SIZE_BY_VALUE: Dict[Any, PaperSize] = {key: m for m in PaperSize for key in (m.value, m)}
+
+
+def _enum_member(members: Mapping[Any, Enum], value: Any, enum_name: str) -> Any:
+    """Look up an enum member by value, raising ValueError like the Enum constructor."""
+    try:
+        return members[value]
+    except (KeyError, TypeError):  # TypeError: unhashable value
+        raise ValueError(f"{value!r} is not a valid {enum_name}") from None
+
+
+# String fields interned by PhotobookConfig.__post_init__
+_INTERNED_FIELDS = (
+    "title_column", "date_column", "image_column", "text_column", "title_font", "text_font",
+)
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to __dict__
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class PhotobookConfig:
-    """Configuration for photobook generation."""
+    """Configuration for photobook generation (immutable)."""
     
     # Layout settings
     layout: Layout = Layout.LANDSCAPE
@@ -55,48 +90,97 @@ class PhotobookConfig:
     title_font: str = "Helvetica-Bold"
     text_font: str = "Helvetica"
     
+    def __post_init__(self) -> None:
+        # Column names are used as dict keys for every entry in the render loop,
+        # and font names key ReportLab's font registry and the text-width cache;
+        # interning lets those lookups match on identity
+        for name in _INTERNED_FIELDS:
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+    
+    @property
+    def columns(self) -> Tuple[str, str, str, str]:
+        """Column names indexed by ColumnKind."""
+        return (self.title_column, self.date_column, self.image_column, self.text_column)
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PhotobookConfig":
-        """Create config from dictionary."""
-        # Handle enum conversions
+        """
+        Create config from dictionary.
+        
+        Configs are immutable, so equal dictionaries share one cached instance.
+        Values are keyed with their type, so 5, 5.0 and True stay distinct.
+        """
+        if cls is not PhotobookConfig:  # subclasses are built without caching
+            return cls._from_dict(data)
+        try:
+            items = frozenset((key, type(value), value) for key, value in data.items())
+        except TypeError:  # unhashable values: build without caching
+            return cls._from_dict(data)
+        return _from_dict_cached(items)
+    
+    @classmethod
+    def _from_dict(cls, data: Dict[str, Any]) -> "PhotobookConfig":
+        """Build config from dictionary, converting enum and path values."""
+        data = dict(data)
+        
+        # Handle enum conversions (unknown values raise ValueError)
         if "layout" in data:
-            data["layout"] = Layout(data["layout"])
+            data["layout"] = _enum_member(_LAYOUT_BY_VALUE, data["layout"], "Layout")
         if "paper_size" in data:
-            data["paper_size"] = PaperSize(data["paper_size"])
+            data["paper_size"] = _enum_member(_PAPER_SIZE_BY_VALUE, data["paper_size"], "PaperSize")
         
-        # Handle path conversions
-        if "background_image" in data and data["background_image"]:
-            data["background_image"] = Path(data["background_image"])
-        if "cover_image" in data and data["cover_image"]:
-            data["cover_image"] = Path(data["cover_image"])
+        # Handle path conversions (values that are already Paths are kept as is)
+        for name in ("background_image", "cover_image"):
+            value = data.get(name)
+            if value and not isinstance(value, Path):
+                data[name] = Path(value)
         
         return cls(**data)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert config to dictionary."""
-        data = {
-            "layout": self.layout.value,
-            "paper_size": self.paper_size.value,
-            "title_column": self.title_column,
-            "date_column": self.date_column,
-            "image_column": self.image_column,
-            "text_column": self.text_column,
-            "title_font_size": self.title_font_size,
-            "text_font_size": self.text_font_size,
-            "margin_mm": self.margin_mm,
-            "image_padding": self.image_padding,
-            "max_image_long_edge_px": self.max_image_long_edge_px,
-            "background_alpha": self.background_alpha,
-            "title_font": self.title_font,
-            "text_font": self.text_font,
-        }
+        """
+        Convert config to dictionary (fields set to None are omitted).
         
-        if self.background_image:
-            data["background_image"] = str(self.background_image)
-        if self.cover_image:
-            data["cover_image"] = str(self.cover_image)
-        
-        return data
+        Configs are immutable, so the dictionary is built once per instance.
+        """
+        cached = _TO_DICT_CACHE.get(id(self))
+        if cached is None:
+            data = {}
+            for name, serialize in _SERIALIZE_FIELDS:
+                value = getattr(self, name)
+                if value is not None:
+                    data[name] = value if serialize is None else serialize(value)
+            if len(_TO_DICT_CACHE) >= _TO_DICT_CACHE_SIZE:
+                _TO_DICT_CACHE.clear()
+            _TO_DICT_CACHE[id(self)] = cached = (self, data)
+        # Values are all immutable, so a shallow copy keeps the cache safe from callers
+        return dict(cached[1])
+
+
+@lru_cache(maxsize=64)
+def _from_dict_cached(items: FrozenSet[Tuple[str, type, Any]]) -> PhotobookConfig:
+    """Memoized PhotobookConfig.from_dict, keyed by (name, type, value) items."""
+    return PhotobookConfig._from_dict({key: value for key, _, value in items})
+
+
+def _field_serializer(field_type: Any) -> Optional[Callable[[Any], Any]]:
+    """Pick the JSON-friendly conversion for a config field type (None: use as is)."""
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        return attrgetter("value")
+    if field_type in (Path, Optional[Path]):
+        return str
+    return None
+
+
+# (field name, converter) pairs, resolved once instead of on every to_dict call
+_SERIALIZE_FIELDS = tuple(
+    (f.name, _field_serializer(f.type)) for f in fields(PhotobookConfig)
+)
+
+# to_dict results by config identity rather than equality (equal configs can hold
+# 5 and 5.0); each entry keeps its config alive so the id is not reused
+_TO_DICT_CACHE: Dict[int, Tuple[PhotobookConfig, Dict[str, Any]]] = {}
+_TO_DICT_CACHE_SIZE = 64
 
 
 # Default configurations
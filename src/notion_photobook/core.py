@@ -4,19 +4,67 @@ Core photobook generator module.
 Main class that orchestrates the entire photobook generation process.
 """
 
-import json
+import itertools
+import logging
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sized, Tuple, Any
 
-from rich.console import Console
+import orjson
 
-from .config import PhotobookConfig, Layout, PaperSize
+try:
+    import ijson
+except ImportError:  # optional: only needed to stream very large JSON files
+    ijson = None
+
+from .config import PhotobookConfig
 from .parser import NotionParser, parse_notion_export
-from .renderer import PhotobookRenderer
 
-# Rich console for consistent output
-console = Console()
+if TYPE_CHECKING:
+    from .renderer import PhotobookRenderer
+
+logger = logging.getLogger(__name__)
+
+# JSON files larger than this are streamed entry by entry when ijson is installed
+STREAM_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+
+@lru_cache(maxsize=8)
+def _load_entries(path: str, mtime_ns: int, size: int) -> Tuple[Mapping[str, Any], ...]:
+    """
+    Parse a JSON entries file, memoized so re-rendering unchanged input skips parsing.
+    
+    The modification time and size are part of the cache key so edited files are
+    reloaded. Entries are stored read-only because cached results are shared;
+    callers work on copies.
+    """
+    return tuple(map(MappingProxyType, orjson.loads(Path(path).read_bytes())))
+
+
+# Sample entries written by create_demo_data, serialized once at import
+_DEMO_ENTRIES: Tuple[Dict[str, str], ...] = (
+    {
+        "Title": "First Day",
+        "Day": "January 1, 2024",
+        "Photos": "demo1.jpg,demo2.jpg",
+        "Text": "This is a sample entry for testing the photobook generator. It contains some text to demonstrate how the layout works with multiple paragraphs.\n\nThis is a second paragraph to show text wrapping and spacing."
+    },
+    {
+        "Title": "Second Day",
+        "Day": "January 2, 2024", 
+        "Photos": "demo3.jpg",
+        "Text": "Another sample entry with just one photo and some text content."
+    },
+    {
+        "Title": "Third Day",
+        "Day": "January 3, 2024",
+        "Photos": "demo4.jpg,demo5.jpg,demo6.jpg",
+        "Text": "This entry has three photos to test the three-photo layout algorithm."
+    }
+)
+_DEMO_BYTES = orjson.dumps(_DEMO_ENTRIES, option=orjson.OPT_INDENT_2)
 
 
 class NotionPhotobookGenerator:
@@ -37,7 +85,12 @@ class NotionPhotobookGenerator:
             config: Configuration object, uses default if None
         """
         self.config = config or PhotobookConfig()
-        self.renderer = PhotobookRenderer(self.config)
+    
+    @cached_property
+    def renderer(self) -> "PhotobookRenderer":
+        """PDF renderer, built on first use so parse-only runs skip PIL/ReportLab."""
+        from .renderer import PhotobookRenderer
+        return PhotobookRenderer(self.config)
     
     def generate_from_notion_export(self, 
                                   input_folder: Path,
@@ -55,7 +108,7 @@ class NotionPhotobookGenerator:
             max_date: Optional maximum date to include
             downsample_images: Whether to downsample images for optimization
         """
-        console.print(f"📖 Parsing Notion export from: {input_folder}")
+        logger.info("📖 Parsing Notion export from: %s", input_folder)
         
         # Parse Notion export
         parser = NotionParser(input_folder)
@@ -64,7 +117,7 @@ class NotionPhotobookGenerator:
         if not entries:
             raise ValueError("No entries found in Notion export")
         
-        console.print(f"📝 Found {len(entries)} entries")
+        logger.info("📝 Found %d entries", len(entries))
         
         # Use input folder as image directory if not specified
         if img_dir is None:
@@ -87,20 +140,41 @@ class NotionPhotobookGenerator:
             img_dir: Directory containing images
             downsample_images: Whether to downsample images for optimization
         """
-        console.print(f"📖 Loading entries from: {json_path}")
+        logger.info("📖 Loading entries from: %s", json_path)
         
-        with open(json_path, 'r', encoding='utf-8') as f:
-            entries = json.load(f)
+        stat = json_path.stat()
+        if ijson is not None and stat.st_size > STREAM_THRESHOLD_BYTES:
+            self._generate_from_json_stream(json_path, output_path, img_dir, downsample_images)
+            return
+        
+        entries = [dict(e) for e in _load_entries(str(json_path), stat.st_mtime_ns, stat.st_size)]
         
         if not entries:
             raise ValueError("No entries found in JSON file")
         
-        console.print(f"📝 Loaded {len(entries)} entries")
+        logger.info("📝 Loaded %d entries", len(entries))
         
         self.generate_from_entries(entries, output_path, img_dir, downsample_images)
     
+    def _generate_from_json_stream(self,
+                                   json_path: Path,
+                                   output_path: Path,
+                                   img_dir: Path,
+                                   downsample_images: bool) -> None:
+        """Render entries while they are parsed, without materializing the whole file."""
+        with open(json_path, 'rb') as f:
+            entries = ijson.items(f, "item", use_float=True)
+            first = next(entries, None)
+            if first is None:
+                raise ValueError("No entries found in JSON file")
+            
+            logger.info("📝 Streaming entries from large JSON file")
+            
+            self.generate_from_entries(itertools.chain([first], entries),
+                                       output_path, img_dir, downsample_images)
+    
     def generate_from_entries(self, 
-                             entries: List[Dict[str, Any]],
+                             entries: Iterable[Dict[str, Any]],
                              output_path: Path,
                              img_dir: Path,
                              downsample_images: bool = True) -> None:
@@ -108,19 +182,23 @@ class NotionPhotobookGenerator:
         Generate photobook from list of entries.
         
         Args:
-            entries: List of diary entries
+            entries: Diary entries (any iterable; consumed once)
             output_path: Output PDF path
             img_dir: Directory containing images
             downsample_images: Whether to downsample images for optimization
         """
-        console.print(f"🎨 Generating photobook...")
-        console.print(f"   Layout: {self.config.layout.value}")
-        console.print(f"   Paper size: {self.config.paper_size.value}")
-        console.print(f"   Images directory: {img_dir}")
+        # Fail before walking the image directory (streamed iterators are checked by the caller)
+        if isinstance(entries, Sized) and not entries:
+            raise ValueError("Cannot generate photobook from empty entries list")
+        
+        logger.info("🎨 Generating photobook...")
+        logger.info("   Layout: %s", self.config.layout.value)
+        logger.info("   Paper size: %s", self.config.paper_size.value)
+        logger.info("   Images directory: %s", img_dir)
         
         # Downsample images if requested
         if downsample_images:
-            console.print("🖼️  Downsampling images for optimization...")
+            logger.info("🖼️  Downsampling images for optimization...")
             self.renderer.downsample_images(img_dir)
         
         # Create photobook
@@ -157,31 +235,9 @@ class NotionPhotobookGenerator:
         Args:
             output_path: Path to save demo JSON
         """
-        demo_entries = [
-            {
-                "Title": "First Day",
-                "Day": "January 1, 2024",
-                "Photos": "demo1.jpg,demo2.jpg",
-                "Text": "This is a sample entry for testing the photobook generator. It contains some text to demonstrate how the layout works with multiple paragraphs.\n\nThis is a second paragraph to show text wrapping and spacing."
-            },
-            {
-                "Title": "Second Day",
-                "Day": "January 2, 2024", 
-                "Photos": "demo3.jpg",
-                "Text": "Another sample entry with just one photo and some text content."
-            },
-            {
-                "Title": "Third Day",
-                "Day": "January 3, 2024",
-                "Photos": "demo4.jpg,demo5.jpg,demo6.jpg",
-                "Text": "This entry has three photos to test the three-photo layout algorithm."
-            }
-        ]
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(demo_entries, f, ensure_ascii=False, indent=2)
-        
-        console.print(f"📝 Demo data saved to: {output_path}")
+        output_path.write_bytes(_DEMO_BYTES)
+        
+        logger.info("📝 Demo data saved to: %s", output_path)
 
 
 def create_photobook(input_folder: Path,
@@ -203,10 +259,8 @@ def create_photobook(input_folder: Path,
         max_date: Optional maximum date to include
         downsample_images: Whether to downsample images for optimization
     """
-    config = PhotobookConfig(
-        layout=Layout(layout),
-        paper_size=PaperSize(paper_size)
-    )
+    # from_dict memoizes on its input, so repeated calls reuse one frozen config
+    config = PhotobookConfig.from_dict({"layout": layout, "paper_size": paper_size})
     
     generator = NotionPhotobookGenerator(config)
     generator.generate_from_notion_export(
@@ -5,18 +5,156 @@ Handles rectangle packing, image positioning, and text layout.
 """
 
 import os
+import shutil
+import struct
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from itertools import accumulate
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 
+import orjson
 from PIL import Image
+from reportlab.lib.pagesizes import A4, A3, A5, letter, legal, landscape
 from reportlab.lib.utils import ImageReader
-from rectpack import newPacker, PackingMode, MaxRectsBssf
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from rectpack import newPacker, PackingMode, MaxRectsBssf, GuillotineBafSas
 from rich.console import Console
 
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_GRAY, TJPF_RGB, TJSAMP_420, TJSAMP_GRAY, TJFLAG_ACCURATEDCT
+except ImportError:  # optional: libjpeg-turbo encodes downsampled JPEGs faster than Pillow
+    TurboJPEG = None
+
 # Rich console for consistent output
 console = Console()
 
+# Paper sizes by PaperSize value
+_PAGE_SIZES = {
+    "A4": A4,
+    "A3": A3,
+    "A5": A5,
+    "letter": letter,
+    "legal": legal,
+}
+
+# Panes rarely hold more photos than this; for such small sets Guillotine packs
+# as densely as MaxRects without its free-list pruning cost
+GUILLOTINE_MAX_RECTS = 20
+
+# Written into the image directory by downsample_images: file name -> [width, height, mtime_ns]
+SIZES_SIDECAR = ".photobook_sizes.json"
+
+
+@lru_cache(maxsize=32)
+def get_image_reader(path: str) -> ImageReader:
+    """
+    Shared ImageReader per image path.
+    
+    The renderer and pack_photos both need readers for the same files; caching
+    them means each file is read and decoded once per document. Call
+    clear_image_readers() when a document is finished to release the data.
+    """
+    return ImageReader(path)
+
+
+def clear_image_readers() -> None:
+    """Release all cached ImageReaders."""
+    get_image_reader.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _turbo_jpeg() -> Optional["TurboJPEG"]:
+    """Shared TurboJPEG encoder, or None if PyTurboJPEG or libturbojpeg is missing."""
+    if TurboJPEG is None:
+        return None
+    try:
+        return TurboJPEG()
+    except (OSError, RuntimeError):
+        return None
+
+
+def _encode_jpeg_turbo(im: Image.Image, quality: int) -> Optional[bytes]:
+    """
+    Encode an RGB or greyscale image as JPEG with libjpeg-turbo.
+    
+    Args:
+        im: Image to encode
+        quality: JPEG quality (1-100)
+        
+    Returns:
+        Encoded JPEG bytes, or None if TurboJPEG is unavailable or the mode
+        is not supported (callers then fall back to Pillow)
+    """
+    turbo = _turbo_jpeg()
+    if turbo is None or im.mode not in ("RGB", "L"):
+        return None
+    
+    if im.mode == "L":
+        pixel_format, subsample = TJPF_GRAY, TJSAMP_GRAY
+    else:
+        pixel_format, subsample = TJPF_RGB, TJSAMP_420
+    encoded: bytes = turbo.encode(np.asarray(im), quality=quality, pixel_format=pixel_format,
+                                  jpeg_subsample=subsample, flags=TJFLAG_ACCURATEDCT)
+    return encoded
+
+
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+
+# JPEG start-of-frame markers (0xC4, 0xC8 and 0xCC share the range but are not SOFs)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _fast_size(path: Path) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) straight from a JPEG SOF segment or PNG IHDR chunk.
+    
+    Much cheaper than constructing a PIL image when only the size is needed.
+    
+    Args:
+        path: Image file path
+        
+    Returns:
+        (width, height), or None if the format is not recognised
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(2)
+            if head == _PNG_MAGIC[:2]:
+                data = head + f.read(22)
+                if data[:8] != _PNG_MAGIC or data[12:16] != b"IHDR":
+                    return None
+                return struct.unpack(">II", data[16:24])
+            
+            if head != b"\xff\xd8":
+                return None
+            while True:
+                marker = f.read(2)
+                if len(marker) != 2 or marker[0] != 0xFF:
+                    return None
+                # Skip fill bytes between markers
+                while marker[1] == 0xFF:
+                    marker = marker[1:] + f.read(1)
+                    if len(marker) != 2:
+                        return None
+                if 0xD0 <= marker[1] <= 0xD9 or marker[1] == 0x01:
+                    continue  # standalone markers carry no length
+                length_bytes = f.read(2)
+                if len(length_bytes) != 2:
+                    return None
+                length = struct.unpack(">H", length_bytes)[0]
+                if marker[1] in _JPEG_SOF_MARKERS:
+                    sof = f.read(5)
+                    if len(sof) != 5:
+                        return None
+                    h, w = struct.unpack(">HH", sof[1:5])
+                    return w, h
+                f.seek(length - 2, os.SEEK_CUR)
+    except OSError:
+        return None
+
 
 class ImageLayout:
     """Handles image layout and positioning."""
@@ -25,48 +163,106 @@ class ImageLayout:
         """Initialize with configuration."""
         self.config = config
         self.max_long_edge_px = config.max_image_long_edge_px
+        self._sizes: Dict[Path, Dict[str, List[int]]] = {}
+    
+    def _load_sizes(self, img_dir: Path) -> Dict[str, List[int]]:
+        """Image sizes recorded in img_dir's sidecar file (empty if there is none)."""
+        sizes = self._sizes.get(img_dir)
+        if sizes is None:
+            try:
+                data = orjson.loads((img_dir / SIZES_SIDECAR).read_bytes())
+            except (OSError, orjson.JSONDecodeError):
+                data = None
+            # Malformed entries are dropped, so those images are measured again
+            sizes = {
+                name: entry for name, entry in data.items()
+                if isinstance(entry, list) and len(entry) == 3
+            } if isinstance(data, dict) else {}
+            self._sizes[img_dir] = sizes
+        return sizes
     
     def downsample_images(self, img_dir: Path) -> None:
         """
         Resize images in directory to optimize memory usage.
         
+        Images are processed on a thread pool; Pillow releases the GIL while
+        decoding, resizing and encoding, so this scales with available cores.
+        The resulting sizes are saved to SIZES_SIDECAR so later layout passes
+        need not open the files again.
+        
         Args:
             img_dir: Directory containing images
         """
         processed_count = 0
         error_count = 0
+        sizes = {}
         
-        for fname in os.listdir(img_dir):
-            if not fname.lower().endswith((".jpg", ".jpeg", ".png")):
-                continue
+        with os.scandir(img_dir) as it:
+            fnames = [entry.name for entry in it
+                      if entry.name.lower().endswith((".jpg", ".jpeg", ".png")) and entry.is_file()]
+        
+        with ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(self._downsample_one, img_dir / fname) for fname in fnames]
             
-            path = img_dir / fname
-            try:
-                with Image.open(path) as im:
-                    w, h = im.size
-                    if max(w, h) <= self.max_long_edge_px:
-                        continue  # already small enough
-                    
-                    # Create backup before modifying
-                    backup_path = path.with_suffix(f".backup{path.suffix}")
-                    if not backup_path.exists():
-                        im.save(backup_path, quality=95)
-                    
-                    scale = self.max_long_edge_px / max(w, h)
-                    new_size = (int(w * scale), int(h * scale))
-                    im = im.resize(new_size, Image.Resampling.LANCZOS)
-                    im.save(path, quality=90, optimize=True)
-                    processed_count += 1
-                    
-            except Exception as e:
-                error_count += 1
-                console.print(f"⚠️  Down-sample skipped for {fname}: {e}")
+            # Collect in submission order so messages stay deterministic
+            for fname, future in zip(fnames, futures):
+                try:
+                    rewritten, (w, h) = future.result()
+                    if rewritten:
+                        processed_count += 1
+                    sizes[fname] = [w, h, (img_dir / fname).stat().st_mtime_ns]
+                except Exception as e:
+                    error_count += 1
+                    console.print(f"⚠️  Down-sample skipped for {fname}: {e}")
+        
+        self._sizes[img_dir] = sizes
+        try:
+            (img_dir / SIZES_SIDECAR).write_bytes(orjson.dumps(sizes))
+        except OSError as e:
+            console.print(f"⚠️  Could not save image sizes: {e}")
         
         if processed_count > 0:
             console.print(f"✅ Downsampled {processed_count} images")
         if error_count > 0:
             console.print(f"⚠️  Failed to downsample {error_count} images")
     
+    def _downsample_one(self, path: Path) -> Tuple[bool, Tuple[int, int]]:
+        """
+        Resize a single image in place.
+        
+        Returns:
+            Whether the file was rewritten, and its (width, height) afterwards
+        """
+        # Skip already-small images without building a PIL image
+        size = _fast_size(path)
+        if size is not None and max(size) <= self.max_long_edge_px:
+            return False, size
+        
+        with Image.open(path) as im:
+            is_jpeg = im.format == "JPEG"
+            w, h = im.size
+            if max(w, h) <= self.max_long_edge_px:
+                return False, (w, h)  # already small enough
+            
+            # Create backup before modifying (copy the original bytes, no re-encode)
+            backup_path = path.with_suffix(f".backup{path.suffix}")
+            if not backup_path.exists():
+                shutil.copy2(path, backup_path)
+            
+            scale = self.max_long_edge_px / max(w, h)
+            new_size = (int(w * scale), int(h * scale))
+            # JPEGs can be decoded straight at a reduced scale (no-op for PNG);
+            # reducing_gap lets Pillow box-reduce before the final Lanczos pass
+            im.draft(im.mode, new_size)
+            im = im.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+            
+            encoded = _encode_jpeg_turbo(im, quality=90) if is_jpeg else None
+            if encoded is not None:
+                path.write_bytes(encoded)
+            else:
+                im.save(path, quality=90, optimize=True)
+            return True, new_size
+    
     def pack_photos(self, photo_paths: List[str], pane_w: float, pane_h: float, 
                    pad: int, img_dir: Path) -> List[Dict[str, Any]]:
         """
@@ -80,22 +276,32 @@ class ImageLayout:
             img_dir: Directory containing images
             
         Returns:
-            List of dictionaries with image layout info
+            List of dictionaries with image layout info; "path" is the image
+            file to draw (see get_image_reader)
         """
         max_long = min(pane_w, pane_h) * 0.6
-        rects, readers = [], {}
+        rects, paths = [], {}
+        sizes = self._load_sizes(img_dir)
         
         for photo_path in photo_paths:
             img_path = img_dir / photo_path
-            if not img_path.exists():
+            try:
+                mtime_ns = img_path.stat().st_mtime_ns
+            except OSError:
                 continue
-                
-            img = Image.open(img_path)
-            w, h = img.size
+            
+            # Only the dimensions are needed here: use the sidecar entry if the
+            # file is unchanged since it was recorded, else read the header
+            cached = sizes.get(photo_path)
+            if cached is not None and cached[2] == mtime_ns:
+                w, h = cached[0], cached[1]
+            else:
+                with Image.open(img_path) as img:
+                    w, h = img.size
             scale = min(max_long / max(w, h), 1.0)
             w_s, h_s = int(w * scale), int(h * scale)
             rects.append((w_s + pad, h_s + pad, photo_path))
-            readers[photo_path] = ImageReader(img)
+            paths[photo_path] = str(img_path)
         
         if not rects:
             return []
@@ -103,7 +309,7 @@ class ImageLayout:
         # Use rectpack for rectangle packing
         packer = newPacker(
             mode=PackingMode.Offline, 
-            pack_algo=MaxRectsBssf,
+            pack_algo=GuillotineBafSas if len(rects) <= GUILLOTINE_MAX_RECTS else MaxRectsBssf,
             rotation=False
         )
         
@@ -117,7 +323,7 @@ class ImageLayout:
         for bin_ in packer:
             for r in bin_:
                 out.append({
-                    "reader": readers[r.rid],
+                    "path": paths[r.rid],
                     "x": r.x,
                     "y": r.y,
                     "w": r.width - pad,
@@ -200,6 +406,12 @@ class ImageLayout:
         return layouts
 
 
+@lru_cache(maxsize=8192)
+def _string_width(text: str, font_name: str, font_size: float) -> float:
+    """Width of text in points, memoized since diary text repeats words heavily."""
+    return stringWidth(text, font_name, font_size)
+
+
 class TextLayout:
     """Handles text layout and wrapping."""
     
@@ -207,6 +419,43 @@ class TextLayout:
         """Initialize with configuration."""
         self.config = config
     
+    def _wrap_words(self, words: List[str], font_name: str, font_size: int,
+                    max_w: float) -> List[str]:
+        """
+        Greedily fill lines with words, measuring each distinct word once.
+        
+        Line breaks are found by bisecting a running sum of cached per-word
+        widths, so the Python-level loop runs once per line rather than once
+        per word. The summed widths can round differently from the measured
+        line, so each break is then checked against the joined line itself.
+        """
+        def fits(start: int, end: int) -> bool:
+            # Whole lines rarely repeat, so they bypass the word-width cache
+            width: float = stringWidth(" ".join(words[start:end]), font_name, font_size)
+            return width <= max_w
+        
+        space_w = _string_width(" ", font_name, font_size)
+        # cum[i] is the width of words[:i], each followed by a space
+        cum = list(accumulate(
+            (_string_width(word, font_name, font_size) + space_w for word in words),
+            initial=0.0,
+        ))
+        lines, start, n = [], 0, len(words)
+        while start < n:
+            end = bisect_right(cum, cum[start] + max_w + space_w, start + 1) - 1
+            while end > start and not fits(start, end):
+                end -= 1
+            while end < n and fits(start, end + 1):
+                end += 1
+            if end == start:
+                # A word wider than the pane gets a line of its own
+                if start == 0:
+                    lines.append("")
+                end += 1
+            lines.append(" ".join(words[start:end]))
+            start = end
+        return lines
+    
     def wrap_text_to_width(self, text: str, font_name: str, font_size: int, 
                           max_w: float) -> List[str]:
         """
@@ -221,28 +470,13 @@ class TextLayout:
         Returns:
             List of wrapped lines
         """
-        from reportlab.pdfbase import pdfmetrics
-        
-        def wrap_para(para: str) -> List[str]:
-            line, out = "", []
-            for word in para.split():
-                test = f"{line} {word}".strip()
-                if pdfmetrics.stringWidth(test, font_name, font_size) <= max_w:
-                    line = test
-                else:
-                    out.append(line)
-                    line = word
-            if line:
-                out.append(line)
-            return out
-        
         lines = []
         for para in text.split("\n\n"):
             para = para.strip()
             if not para:
                 lines.append("")
                 continue
-            lines.extend(wrap_para(para))
+            lines.extend(self._wrap_words(para.split(), font_name, font_size, max_w))
             lines.append("")
         
         if lines and lines[-1] == "":
@@ -253,26 +487,10 @@ class TextLayout:
     def wrap_title(self, title: str, font_name: str, font_size: int, 
                    max_w: float) -> List[str]:
         """Wrap title text to fit within specified width."""
-        from reportlab.pdfbase import pdfmetrics
-        
-        title_lines = []
         if not title:
-            return title_lines
-        
-        words = title.split()
-        curr = ''
-        for word in words:
-            test = f"{curr} {word}".strip()
-            if pdfmetrics.stringWidth(test, font_name, font_size) <= max_w:
-                curr = test
-            else:
-                title_lines.append(curr)
-                curr = word
-        
-        if curr:
-            title_lines.append(curr)
+            return []
         
-        return title_lines
+        return self._wrap_words(title.split(), font_name, font_size, max_w)
 
 
 class LayoutEngine:
@@ -283,29 +501,28 @@ class LayoutEngine:
         self.config = config
         self.image_layout = ImageLayout(config)
         self.text_layout = TextLayout(config)
+        self._page_size: Optional[Tuple[float, float]] = None
+        self._pane_dimensions: Dict[Tuple[float, float, float], Tuple[float, float]] = {}
     
     def get_page_size(self) -> Tuple[float, float]:
-        """Get page size based on configuration."""
-        from reportlab.lib.pagesizes import A4, A3, A5, letter, legal, landscape
-        
-        size_map = {
-            "A4": A4,
-            "A3": A3,
-            "A5": A5,
-            "letter": letter,
-            "legal": legal,
-        }
-        
-        pagesize = size_map.get(self.config.paper_size.value, A4)
+        """Get page size based on configuration (computed once per engine)."""
+        if self._page_size is None:
+            pagesize = _PAGE_SIZES.get(self.config.paper_size.value, A4)
+            
+            if self.config.layout.value == "landscape":
+                pagesize = landscape(pagesize)
+            self._page_size = pagesize
         
-        if self.config.layout.value == "landscape":
-            return landscape(pagesize)
-        else:
-            return pagesize
+        return self._page_size
     
     def calculate_pane_dimensions(self, page_w: float, page_h: float, 
                                  margin: float) -> Tuple[float, float]:
         """Calculate pane dimensions based on layout."""
+        key = (page_w, page_h, margin)
+        dims = self._pane_dimensions.get(key)
+        if dims is not None:
+            return dims
+        
         if self.config.layout.value == "landscape":
             # Two panes side by side
             pane_w = (page_w - 3 * margin) / 2
@@ -315,4 +532,5 @@ class LayoutEngine:
             pane_w = page_w - 2 * margin
             pane_h = page_h - 2 * margin
         
-        return pane_w, pane_h 
\ No newline at end of file
+        dims = self._pane_dimensions[key] = (pane_w, pane_h)
+        return dims
@@ -6,7 +6,7 @@ Handles PDF creation using ReportLab with background images and text rendering.
 
 import gc
 from functools import lru_cache
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Optional, Any
 from pathlib import Path
 
 from PIL import Image
@@ -19,11 +19,40 @@ from reportlab.pdfbase.ttfonts import TTFont
 from tqdm import tqdm
 from rich.console import Console
 
-from .layout import LayoutEngine, ImageLayout, TextLayout
+from .layout import (
+    LayoutEngine, ImageLayout, TextLayout, clear_image_readers, get_image_reader,
+)
 
 # Rich console for consistent output
 console = Console()
 
+# Name of the form XObject holding the faded background image
+BACKGROUND_FORM = "background"
+
+
+def _lines_that_fit(y: float, leading: float, margin: float, text_sz: float) -> int:
+    """
+    Count text lines that fit when the first baseline is at y.
+    
+    Baselines are stepped down the way PDFTextObject.textLine moves the
+    cursor, so a baseline landing on the bottom limit rounds exactly as it
+    does when the lines are drawn.
+    
+    Args:
+        y: Baseline of the first line
+        leading: Distance between baselines
+        margin: Bottom margin
+        text_sz: Text font size (a baseline must stay this far above the margin)
+        
+    Returns:
+        Number of lines whose baseline is at least text_sz above the margin
+    """
+    count = 0
+    while y - margin >= text_sz:
+        count += 1
+        y -= leading
+    return count
+
 
 class BackgroundRenderer:
     """Handles background image rendering."""
@@ -52,10 +81,21 @@ class BackgroundRenderer:
         return ImageReader(faded)
     
     def draw_background(self, canvas_obj: canvas.Canvas, page_w: float, page_h: float) -> None:
-        """Draw background on current page."""
-        faded_bg = self.get_faded_background_reader(self.config.background_alpha)
-        if faded_bg:
+        """
+        Draw background on current page.
+        
+        The faded image is drawn once into a form XObject per document; each
+        page then only references that form.
+        """
+        if not canvas_obj.hasForm(BACKGROUND_FORM):
+            faded_bg = self.get_faded_background_reader(self.config.background_alpha)
+            if not faded_bg:
+                return
+            canvas_obj.beginForm(BACKGROUND_FORM)
             canvas_obj.drawImage(faded_bg, 0, 0, width=page_w, height=page_h, mask='auto')
+            canvas_obj.endForm()
+        
+        canvas_obj.doForm(BACKGROUND_FORM)
 
 
 class CoverRenderer:
@@ -98,13 +138,13 @@ class PhotobookRenderer:
         self.image_layout = ImageLayout(config)
         self.text_layout = TextLayout(config)
     
-    def create_photobook(self, entries: List[Dict[str, Any]], output_path: Path, 
+    def create_photobook(self, entries: Iterable[Dict[str, Any]], output_path: Path, 
                         img_dir: Path) -> None:
         """
         Create photobook PDF from entries.
         
         Args:
-            entries: List of diary entries
+            entries: Diary entries (any iterable; consumed once)
             output_path: Output PDF path
             img_dir: Directory containing images
         """
@@ -113,159 +153,182 @@ class PhotobookRenderer:
         margin = self.config.margin_mm * mm
         pane_w, pane_h = self.layout_engine.calculate_pane_dimensions(page_w, page_h, margin)
         
-        # Create canvas
-        c = canvas.Canvas(str(output_path), pagesize=(page_w, page_h))
+        # Create canvas; content streams are always zlib-compressed (regardless of
+        # the global rl_config default) and invariant output is byte-reproducible
+        c = canvas.Canvas(str(output_path), pagesize=(page_w, page_h),
+                          pageCompression=1, invariant=1)
         
-        # Draw cover page
-        self.cover_renderer.draw_cover_page(c, page_w, page_h)
-        
-        # Start first content page
-        self.background_renderer.draw_background(c, page_w, page_h)
-        
-        # Layout parameters
-        title_sz = self.config.title_font_size
-        text_sz = self.config.text_font_size
-        pad = self.config.image_padding
-        img_pad = self.config.image_padding
-        
-        pane_idx = 0
-        
-        for idx, entry in enumerate(tqdm(entries, desc="Generating pages")):
-            # Calculate pane position
-            col = pane_idx % 2 if self.config.layout.value == "landscape" else 0
-            
-            if pane_idx and col == 0:
-                c.showPage()
-                self.background_renderer.draw_background(c, page_w, page_h)
+        # Cached image readers are released even if rendering fails
+        try:
+            # Draw cover page
+            self.cover_renderer.draw_cover_page(c, page_w, page_h)
             
-            x0 = margin + col * (pane_w + margin) if self.config.layout.value == "landscape" else margin
-            y0 = page_h - margin
+            # Start first content page
+            self.background_renderer.draw_background(c, page_w, page_h)
             
-            # Draw title
-            day = entry.get(self.config.date_column, '').strip()
-            title_text = entry.get(self.config.title_column, '').strip()
-            full_title = f"{day} - {title_text}" if day and title_text else (day or title_text)
-            
-            c.setFont(self.config.title_font, title_sz)
-            title_lines = self.text_layout.wrap_title(full_title, self.config.title_font, title_sz, pane_w)
+            # Layout parameters
+            title_sz = self.config.title_font_size
+            text_sz = self.config.text_font_size
+            pad = self.config.image_padding
+            img_pad = self.config.image_padding
             
+            # Bind per-document constants once; the entry loop below runs per page
+            is_landscape = self.config.layout.value == "landscape"
+            title_font = self.config.title_font
+            text_font = self.config.text_font
+            title_col, date_col, image_col, text_col = self.config.columns
             title_leading = title_sz * 1.2
-            y_title = y0 - title_leading
+            leading = text_sz * 1.2
+            wrap_title = self.text_layout.wrap_title
+            wrap_text = self.text_layout.wrap_text_to_width
+            draw_bg = self.background_renderer.draw_background
             
-            for line in title_lines:
-                c.drawString(x0, y_title, line)
-                y_title -= title_leading
+            # Continuation panes start below a title-sized gap and always take at least one line
+            y_cont = page_h - margin - title_sz - pad
+            cont_lines = max(1, _lines_that_fit(y_cont, leading, margin, text_sz))
             
-            y_curr = y_title - title_leading * 0.5
+            pane_idx = 0
             
-            # Handle images
-            photos = [p.strip() for p in entry.get(self.config.image_column, '').split(',') if p.strip()]
-            if photos:
-                txt = entry.get(self.config.text_column, '').strip()
-                ph = (pane_h - title_sz - pad) if not txt else pane_h * 0.40
+            for idx, entry in enumerate(tqdm(entries, desc="Generating pages")):
+                # Calculate pane position
+                col = pane_idx % 2 if is_landscape else 0
                 
-                # Load image readers
-                img_readers = []
-                for photo in photos:
-                    img_path = img_dir / photo
-                    if img_path.exists():
-                        img_readers.append(ImageReader(img_path))
+                if pane_idx and col == 0:
+                    c.showPage()
+                    draw_bg(c, page_w, page_h)
                 
-                if img_readers:
-                    y_base = y_curr - ph
-                    
-                    # Ensure bottom margin is respected
-                    if y_base < margin:
-                        shift_up = margin - y_base
-                        y_base += shift_up
-                        y_curr += shift_up
-                    
-                    # Layout images based on count
-                    n = len(img_readers)
-                    if n == 1:
-                        x_img, y_img, dw, dh = self.image_layout.layout_single_photo(
-                            img_readers[0], pane_w, ph
-                        )
-                        c.drawImage(img_readers[0], x0 + x_img, y_base + y_img, 
-                                   width=dw, height=dh, mask='auto')
+                x0 = margin + col * (pane_w + margin) if is_landscape else margin
+                y0 = page_h - margin
+                
+                # Draw title
+                day = entry.get(date_col, '').strip()
+                title_text = entry.get(title_col, '').strip()
+                full_title = f"{day} - {title_text}" if day and title_text else (day or title_text)
+                
+                c.setFont(title_font, title_sz)
+                title_lines = wrap_title(full_title, title_font, title_sz, pane_w)
+                
+                y_title = y0 - title_leading
+                
+                for line in title_lines:
+                    c.drawString(x0, y_title, line)
+                    y_title -= title_leading
+                
+                y_curr = y_title - title_leading * 0.5
+                
+                txt = entry.get(text_col, '').strip()
+                
+                # Handle images
+                photos = [p.strip() for p in entry.get(image_col, '').split(',') if p.strip()]
+                if photos:
+                    ph = (pane_h - title_sz - pad) if not txt else pane_h * 0.40
                     
-                    elif n == 2:
-                        layouts = self.image_layout.layout_two_photos(
-                            img_readers, pane_w, ph, img_pad
-                        )
-                        for layout in layouts:
-                            c.drawImage(layout["reader"], x0 + layout["x"], 
-                                       y_base + layout["y"], width=layout["w"], 
-                                       height=layout["h"], mask='auto')
+                    existing = []
+                    for photo in photos:
+                        img_path = img_dir / photo
+                        if img_path.exists():
+                            existing.append(str(img_path))
+                    n = len(existing)
                     
-                    elif n == 3:
-                        layouts = self.image_layout.layout_three_photos(
-                            img_readers, pane_w, ph, img_pad
-                        )
-                        for layout in layouts:
-                            c.drawImage(layout["reader"], x0 + layout["x"], 
-                                       y_base + layout["y"], width=layout["w"], 
-                                       height=layout["h"], mask='auto')
+                    # Up to three photos are laid out from reader sizes; the packing
+                    # path for 4+ only needs header dimensions and loads readers to draw
+                    img_readers = [get_image_reader(path) for path in existing] if n <= 3 else []
                     
-                    else:
-                        # Use rectangle packing for 4+ images
-                        slots = self.image_layout.pack_photos(photos, pane_w, ph, img_pad, img_dir)
+                    if existing:
+                        y_base = y_curr - ph
                         
-                        if slots:
-                            cluster_h = max(s["y"] + s["h"] for s in slots)
-                            y_offset = ph - cluster_h
+                        # Ensure bottom margin is respected
+                        if y_base < margin:
+                            shift_up = margin - y_base
+                            y_base += shift_up
+                            y_curr += shift_up
+                        
+                        # Layout images based on count
+                        if n == 1:
+                            x_img, y_img, dw, dh = self.image_layout.layout_single_photo(
+                                img_readers[0], pane_w, ph
+                            )
+                            c.drawImage(img_readers[0], x0 + x_img, y_base + y_img, 
+                                       width=dw, height=dh, mask='auto')
+                        
+                        elif n == 2:
+                            layouts = self.image_layout.layout_two_photos(
+                                img_readers, pane_w, ph, img_pad
+                            )
+                            for layout in layouts:
+                                c.drawImage(layout["reader"], x0 + layout["x"], 
+                                           y_base + layout["y"], width=layout["w"], 
+                                           height=layout["h"], mask='auto')
+                        
+                        elif n == 3:
+                            layouts = self.image_layout.layout_three_photos(
+                                img_readers, pane_w, ph, img_pad
+                            )
+                            for layout in layouts:
+                                c.drawImage(layout["reader"], x0 + layout["x"], 
+                                           y_base + layout["y"], width=layout["w"], 
+                                           height=layout["h"], mask='auto')
+                        
+                        else:
+                            # Use rectangle packing for 4+ images
+                            slots = self.image_layout.pack_photos(photos, pane_w, ph, img_pad, img_dir)
                             
-                            for slot in slots:
-                                c.drawImage(slot["reader"], x0 + slot["x"], 
-                                           y_base + y_offset + slot["y"], 
-                                           width=slot["w"], height=slot["h"], 
-                                           mask='auto')
-                    
-                    y_curr -= ph + pad
-            
-            # Handle text
-            txt = entry.get(self.config.text_column, '').strip()
-            if txt:
-                c.setFont(self.config.text_font, text_sz)
-                wrapped = self.text_layout.wrap_text_to_width(
-                    txt, self.config.text_font, text_sz, pane_w - pad * 2
-                )
-                leading = text_sz * 1.2
-                
-                t = c.beginText(x0, y_curr)
-                t.setFont(self.config.text_font, text_sz)
-                t.setLeading(leading)
-                t.textLine("")  # Blank line after photos
+                            if slots:
+                                cluster_h = max(s["y"] + s["h"] for s in slots)
+                                y_offset = ph - cluster_h
+                                
+                                for slot in slots:
+                                    c.drawImage(get_image_reader(slot["path"]), x0 + slot["x"], 
+                                               y_base + y_offset + slot["y"], 
+                                               width=slot["w"], height=slot["h"], 
+                                               mask='auto')
+                        
+                        y_curr -= ph + pad
                 
-                i = 0
-                while i < len(wrapped):
-                    if t.getY() - margin < text_sz:
+                # Handle text
+                if txt:
+                    c.setFont(text_font, text_sz)
+                    wrapped = wrap_text(txt, text_font, text_sz, pane_w - pad * 2)
+                    
+                    t = c.beginText(x0, y_curr)
+                    t.setFont(text_font, text_sz)
+                    t.setLeading(leading)
+                    t.textLine("")  # Blank line after photos
+                    
+                    # Fill the rest of this pane, then whole continuation panes
+                    end = _lines_that_fit(t.getY(), leading, margin, text_sz)
+                    for line in wrapped[:end]:
+                        t.textLine(line)
+                    
+                    while end < len(wrapped):
                         c.drawText(t)
                         pane_idx += 1
-                        col = pane_idx % 2 if self.config.layout.value == "landscape" else 0
+                        col = pane_idx % 2 if is_landscape else 0
                         
                         if col == 0:
                             c.showPage()
-                            self.background_renderer.draw_background(c, page_w, page_h)
+                            draw_bg(c, page_w, page_h)
                         
-                        x_p = margin + col * (pane_w + margin) if self.config.layout.value == "landscape" else margin
-                        y_p = page_h - margin - title_sz - pad
+                        x_p = margin + col * (pane_w + margin) if is_landscape else margin
                         
-                        t = c.beginText(x_p, y_p)
-                        t.setFont(self.config.text_font, text_sz)
+                        t = c.beginText(x_p, y_cont)
+                        t.setFont(text_font, text_sz)
                         t.setLeading(leading)
+                        
+                        start, end = end, end + cont_lines
+                        for line in wrapped[start:end]:
+                            t.textLine(line)
                     
-                    t.textLine(wrapped[i])
-                    i += 1
-                
-                c.drawText(t)
-                pane_idx += 1
-            else:
-                pane_idx += 1
-        
-        c.save()
+                    c.drawText(t)
+                    pane_idx += 1
+                else:
+                    pane_idx += 1
+            
+            c.save()
+        finally:
+            clear_image_readers()
         console.print(f"✅ Photobook saved to: {output_path}")
-        console.print(f"📄 Total pages: ≈ {pane_idx // 2 + pane_idx % 2 if self.config.layout.value == 'landscape' else pane_idx}")
+        console.print(f"📄 Total pages: ≈ {pane_idx // 2 + pane_idx % 2 if is_landscape else pane_idx}")
     
     def downsample_images(self, img_dir: Path) -> None:
         """Downsample images in directory to optimize memory usage."""
@@ -0,0 +1,40 @@
+"""
+Shared pytest fixtures.
+"""
+
+import orjson
+import pytest
+
+
+@pytest.fixture(scope="session")
+def base_img_dir(tmp_path_factory):
+    """
+    Image directory with a placeholder test1.jpg, built once per test session.
+    
+    Shared between tests, so tests must not write to it; copy it into
+    tmp_path first when a test needs to modify images.
+    """
+    img_dir = tmp_path_factory.mktemp("images")
+    (img_dir / "test1.jpg").touch()
+    return img_dir
+
+
+@pytest.fixture(scope="session")
+def sample_entries():
+    """Diary entries matching the placeholder image in base_img_dir."""
+    return [
+        {
+            "Title": "Test Entry",
+            "Day": "January 1, 2024",
+            "Photos": "test1.jpg",
+            "Text": "Test content"
+        }
+    ]
+
+
+@pytest.fixture(scope="session")
+def sample_json(tmp_path_factory, sample_entries):
+    """Path to sample_entries written as JSON once per test session (read-only)."""
+    json_path = tmp_path_factory.mktemp("json") / "test.json"
+    json_path.write_bytes(orjson.dumps(sample_entries))
+    return json_path
@@ -2,24 +2,26 @@
 Tests for configuration module.
 """
 
+import sys
+from dataclasses import FrozenInstanceError, fields
+
 import pytest
 from pathlib import Path
 
-from notion_photobook.config import PhotobookConfig, Layout, PaperSize
+from notion_photobook.config import PhotobookConfig, Layout, PaperSize, ColumnKind
 
 
 class TestLayout:
     """Test Layout enum."""
     
-    def test_layout_values(self):
-        """Test layout enum values."""
-        assert Layout.PORTRAIT.value == "portrait"
-        assert Layout.LANDSCAPE.value == "landscape"
-    
-    def test_layout_from_string(self):
-        """Test creating layout from string."""
-        assert Layout("portrait") == Layout.PORTRAIT
-        assert Layout("landscape") == Layout.LANDSCAPE
+    @pytest.mark.parametrize("value,member", [
+        ("portrait", Layout.PORTRAIT),
+        ("landscape", Layout.LANDSCAPE),
+    ])
+    def test_layout_roundtrip(self, value, member):
+        """Test layout enum values and creating layouts from strings."""
+        assert member.value == value
+        assert Layout(value) is member
     
     def test_invalid_layout(self):
         """Test invalid layout raises error."""
@@ -30,18 +32,17 @@ class TestLayout:
 class TestPaperSize:
     """Test PaperSize enum."""
     
-    def test_paper_size_values(self):
-        """Test paper size enum values."""
-        assert PaperSize.A4.value == "A4"
-        assert PaperSize.A3.value == "A3"
-        assert PaperSize.A5.value == "A5"
-        assert PaperSize.LETTER.value == "letter"
-        assert PaperSize.LEGAL.value == "legal"
-    
-    def test_paper_size_from_string(self):
-        """Test creating paper size from string."""
-        assert PaperSize("A4") == PaperSize.A4
-        assert PaperSize("letter") == PaperSize.LETTER
+    @pytest.mark.parametrize("value,member", [
+        ("A4", PaperSize.A4),
+        ("A3", PaperSize.A3),
+        ("A5", PaperSize.A5),
+        ("letter", PaperSize.LETTER),
+        ("legal", PaperSize.LEGAL),
+    ])
+    def test_paper_size_roundtrip(self, value, member):
+        """Test paper size enum values and creating paper sizes from strings."""
+        assert member.value == value
+        assert PaperSize(value) is member
     
     def test_invalid_paper_size(self):
         """Test invalid paper size raises error."""
@@ -62,6 +63,10 @@ class TestPhotobookConfig:
         assert config.date_column == "Day"
         assert config.image_column == "Photos"
         assert config.text_column == "Text"
+        assert config.columns[ColumnKind.TITLE] == "Title"
+        assert config.columns[ColumnKind.DATE] == "Day"
+        assert config.columns[ColumnKind.IMAGE] == "Photos"
+        assert config.columns[ColumnKind.TEXT] == "Text"
         assert config.title_font_size == 16
         assert config.text_font_size == 10
         assert config.margin_mm == 5
@@ -99,6 +104,21 @@ class TestPhotobookConfig:
         assert config.title_font == "Arial-Bold"
         assert config.text_font == "Arial"
     
+    def test_column_names_interned(self):
+        """Test column names are interned for fast entry lookups."""
+        title_column = "".join(["Entry ", "Title"])
+        config = PhotobookConfig(title_column=title_column)
+        
+        assert config.title_column == "Entry Title"
+        assert config.title_column is sys.intern("Entry Title")
+    
+    def test_font_names_interned(self):
+        """Test font names, including JSON-style copies, are interned."""
+        config = PhotobookConfig.from_dict({"text_font": "".join(["Times-", "Roman"])})
+        
+        assert config.text_font is sys.intern("Times-Roman")
+        assert config.title_font is sys.intern("Helvetica-Bold")
+    
     def test_from_dict(self):
         """Test creating config from dictionary."""
         data = {
@@ -119,6 +139,58 @@ class TestPhotobookConfig:
         assert config.background_image == Path("/path/to/bg.png")
         assert config.cover_image == Path("/path/to/cover.jpg")
     
+    def test_from_dict_enum_members_and_invalid_values(self):
+        """Test from_dict accepts enum members and rejects unknown values."""
+        config = PhotobookConfig.from_dict({"layout": Layout.PORTRAIT, "paper_size": "legal"})
+        
+        assert config.layout == Layout.PORTRAIT
+        assert config.paper_size == PaperSize.LEGAL
+        with pytest.raises(ValueError):
+            PhotobookConfig.from_dict({"layout": "invalid"})
+        with pytest.raises(ValueError, match="'invalid' is not a valid PaperSize"):
+            PhotobookConfig.from_dict({"paper_size": "invalid"})
+        with pytest.raises(ValueError):
+            PhotobookConfig.from_dict({"layout": ["portrait"]})
+    
+    def test_from_dict_keeps_path_objects(self):
+        """Test Path values are used without being rebuilt."""
+        background = Path("/path/to/bg.png")
+        
+        config = PhotobookConfig.from_dict({"background_image": background, "cover_image": None})
+        
+        assert config.background_image is background
+        assert config.cover_image is None
+    
+    def test_from_dict_is_cached(self):
+        """Test equal dictionaries share one config and the input is not modified."""
+        data = {"layout": "portrait", "background_image": "/path/to/bg.png"}
+        
+        config = PhotobookConfig.from_dict(data)
+        
+        assert PhotobookConfig.from_dict(dict(data)) is config
+        assert data == {"layout": "portrait", "background_image": "/path/to/bg.png"}
+    
+    def test_from_dict_cache_keeps_value_types(self):
+        """Test equal values of different types do not share a cached config."""
+        assert type(PhotobookConfig.from_dict({"margin_mm": 5.0}).margin_mm) is float
+        assert type(PhotobookConfig.from_dict({"margin_mm": 5}).margin_mm) is int
+        assert PhotobookConfig.from_dict({"margin_mm": True}).margin_mm is True
+    
+    def test_config_is_frozen(self):
+        """Test configs cannot be modified after creation."""
+        config = PhotobookConfig()
+        
+        with pytest.raises(FrozenInstanceError):
+            config.margin_mm = 10
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+    def test_config_uses_slots(self):
+        """Test configs store fields in slots rather than an instance __dict__."""
+        config = PhotobookConfig.from_dict({"layout": "portrait"})
+        
+        assert not hasattr(config, "__dict__")
+        assert config.columns == ("Title", "Day", "Photos", "Text")
+    
     def test_to_dict(self):
         """Test converting config to dictionary."""
         config = PhotobookConfig(
@@ -136,6 +208,23 @@ class TestPhotobookConfig:
         assert "background_image" not in data  # None values excluded
         assert "cover_image" not in data  # None values excluded
     
+    def test_to_dict_is_cached_but_not_shared(self):
+        """Test repeated to_dict calls return equal, independent dictionaries."""
+        config = PhotobookConfig()
+        
+        data = config.to_dict()
+        data["layout"] = "changed"
+        
+        assert config.to_dict()["layout"] == "landscape"
+        assert config == PhotobookConfig()
+        # The cache lives outside the dataclass fields
+        assert {f.name for f in fields(config)} == set(data) | {"background_image", "cover_image"}
+    
+    def test_to_dict_cache_keeps_value_types(self):
+        """Test equal configs holding values of different types keep their own dict."""
+        assert type(PhotobookConfig(margin_mm=5).to_dict()["margin_mm"]) is int
+        assert type(PhotobookConfig(margin_mm=5.0).to_dict()["margin_mm"]) is float
+    
     def test_to_dict_with_paths(self):
         """Test converting config with paths to dictionary."""
         config = PhotobookConfig(
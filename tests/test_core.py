@@ -2,18 +2,32 @@
 Tests for core module.
 """
 
-import json
 import tempfile
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import orjson
 import pytest
 
 from notion_photobook.core import NotionPhotobookGenerator, create_photobook
 from notion_photobook.config import PhotobookConfig, Layout, PaperSize
 
 
+class _FakeRenderer:
+    """Renderer stand-in that records calls without Mock's attribute bookkeeping."""
+    
+    def __init__(self):
+        self.calls = []
+        self.downsampled = []
+    
+    def create_photobook(self, entries, output_path, img_dir):
+        self.calls.append((list(entries), output_path, img_dir))
+    
+    def downsample_images(self, img_dir):
+        self.downsampled.append(img_dir)
+
+
 class TestNotionPhotobookGenerator:
     """Test NotionPhotobookGenerator class."""
     
@@ -38,75 +52,130 @@ class TestNotionPhotobookGenerator:
         
         assert demo_path.exists()
         
-        with open(demo_path, 'r') as f:
-            data = json.load(f)
+        data = orjson.loads(demo_path.read_bytes())
         
         assert len(data) == 3
         assert data[0]["Title"] == "First Day"
         assert data[0]["Day"] == "January 1, 2024"
         assert "demo1.jpg" in data[0]["Photos"]
     
-    def test_generate_from_json(self, tmp_path):
+    def test_generate_from_json(self, tmp_path, base_img_dir, sample_json, sample_entries):
         """Test generating photobook from JSON."""
-        # Create test JSON
-        test_entries = [
-            {
-                "Title": "Test Entry",
-                "Day": "January 1, 2024",
-                "Photos": "test1.jpg",
-                "Text": "Test content"
-            }
-        ]
-        
-        json_path = tmp_path / "test.json"
-        with open(json_path, 'w') as f:
-            json.dump(test_entries, f)
+        # Shared JSON file holding sample_entries
+        json_path = sample_json
         
-        # Create image directory
-        img_dir = tmp_path / "images"
-        img_dir.mkdir()
+        # Shared image directory with a dummy test1.jpg
+        img_dir = base_img_dir
         
-        # Create a dummy image file
-        (img_dir / "test1.jpg").touch()
-        
-        # Mock the renderer to avoid actual PDF generation
+        # Mock the renderer to avoid actual PDF generation (and writes to img_dir)
         generator = NotionPhotobookGenerator()
         generator.renderer.create_photobook = Mock()
+        generator.renderer.downsample_images = Mock()
         
         output_path = tmp_path / "output.pdf"
         generator.generate_from_json(json_path, output_path, img_dir)
         
         # Check that renderer was called
-        generator.renderer.create_photobook.assert_called_once()
+        assert generator.renderer.create_photobook.call_count == 1
         args = generator.renderer.create_photobook.call_args
-        assert args[0][0] == test_entries  # entries
-        assert args[0][1] == output_path   # output_path
-        assert args[0][2] == img_dir       # img_dir
+        assert args[0][0] == sample_entries  # entries
+        assert args[0][1] == output_path     # output_path
+        assert args[0][2] == img_dir         # img_dir
+        assert generator.renderer.downsample_images.call_count == 1
+        assert generator.renderer.downsample_images.call_args[0] == (img_dir,)
     
-    def test_generate_from_json_empty(self, tmp_path):
+    def test_generate_from_json_empty(self, tmp_path, base_img_dir):
         """Test generating photobook from empty JSON."""
         json_path = tmp_path / "empty.json"
-        with open(json_path, 'w') as f:
-            json.dump([], f)
+        json_path.write_bytes(orjson.dumps([]))
         
         generator = NotionPhotobookGenerator()
         output_path = tmp_path / "output.pdf"
-        img_dir = tmp_path / "images"
-        img_dir.mkdir()
+        img_dir = base_img_dir
         
         with pytest.raises(ValueError, match="No entries found"):
             generator.generate_from_json(json_path, output_path, img_dir)
     
-    def test_generate_from_json_file_not_found(self, tmp_path):
+    def test_generate_from_entries_empty(self, tmp_path):
+        """Test empty entries fail before touching the image directory."""
+        generator = NotionPhotobookGenerator()
+        generator.renderer = _FakeRenderer()
+        
+        with pytest.raises(ValueError, match="empty entries"):
+            generator.generate_from_entries([], tmp_path / "output.pdf", tmp_path)
+        
+        assert generator.renderer.downsampled == []
+    
+    def test_generate_from_json_file_not_found(self, tmp_path, base_img_dir):
         """Test generating photobook from non-existent JSON."""
         generator = NotionPhotobookGenerator()
         json_path = tmp_path / "nonexistent.json"
         output_path = tmp_path / "output.pdf"
-        img_dir = tmp_path / "images"
-        img_dir.mkdir()
+        img_dir = base_img_dir
         
         with pytest.raises(FileNotFoundError):
             generator.generate_from_json(json_path, output_path, img_dir)
+    
+    def test_generate_from_json_reuses_parsed_entries(self, tmp_path, base_img_dir):
+        """Test unchanged JSON is parsed once and edited JSON is reloaded."""
+        json_path = tmp_path / "entries.json"
+        json_path.write_bytes(orjson.dumps([{"Title": "First"}]))
+        img_dir = base_img_dir
+        
+        generator = NotionPhotobookGenerator()
+        generator.renderer = _FakeRenderer()
+        output_path = tmp_path / "output.pdf"
+        
+        with patch("notion_photobook.core.orjson.loads", wraps=orjson.loads) as loads:
+            generator.generate_from_json(json_path, output_path, img_dir, downsample_images=False)
+            generator.generate_from_json(json_path, output_path, img_dir, downsample_images=False)
+            assert loads.call_count == 1
+            
+            json_path.write_bytes(orjson.dumps([{"Title": "Edited entry"}]))
+            generator.generate_from_json(json_path, output_path, img_dir, downsample_images=False)
+            assert loads.call_count == 2
+        
+        assert generator.renderer.calls[-1] == ([{"Title": "Edited entry"}], output_path, img_dir)
+    
+    def test_generate_from_json_hands_out_entry_copies(self, tmp_path, base_img_dir):
+        """Test cached entries reach the renderer as mutable dicts without being shared."""
+        json_path = tmp_path / "entries.json"
+        json_path.write_bytes(orjson.dumps([{"Title": "First"}]))
+        
+        generator = NotionPhotobookGenerator()
+        generator.renderer = _FakeRenderer()
+        output_path = tmp_path / "output.pdf"
+        
+        generator.generate_from_json(json_path, output_path, base_img_dir, downsample_images=False)
+        entry = generator.renderer.calls[0][0][0]
+        assert type(entry) is dict
+        entry["Title"] = "Changed"
+        
+        generator.generate_from_json(json_path, output_path, base_img_dir, downsample_images=False)
+        assert generator.renderer.calls[1][0] == [{"Title": "First"}]
+    
+    def test_generate_from_json_streams_large_files(self, tmp_path, base_img_dir, monkeypatch):
+        """Test that files above the threshold are streamed to the renderer."""
+        pytest.importorskip("ijson")
+        monkeypatch.setattr("notion_photobook.core.STREAM_THRESHOLD_BYTES", 0)
+        
+        test_entries = [
+            {"Title": "First", "Day": "January 1, 2024", "Photos": "", "Text": "One"},
+            {"Title": "Second", "Day": "January 2, 2024", "Photos": "", "Text": "Two"},
+        ]
+        json_path = tmp_path / "large.json"
+        json_path.write_bytes(orjson.dumps(test_entries))
+        
+        img_dir = base_img_dir
+        
+        generator = NotionPhotobookGenerator()
+        generator.renderer = _FakeRenderer()
+        output_path = tmp_path / "output.pdf"
+        
+        generator.generate_from_json(json_path, output_path, img_dir)
+        
+        assert generator.renderer.downsampled == [img_dir]
+        assert generator.renderer.calls == [(test_entries, output_path, img_dir)]
 
 
 class TestCreatePhotobook:
@@ -130,14 +199,24 @@ class TestCreatePhotobook:
         )
         
         # Check that generator was created with correct config
-        mock_generator_class.assert_called_once()
+        assert mock_generator_class.call_count == 1
         config = mock_generator_class.call_args[0][0]
         assert config.layout == Layout.PORTRAIT
         assert config.paper_size == PaperSize.A4
         
         # Check that generate_from_notion_export was called
-        mock_generator.generate_from_notion_export.assert_called_once()
+        assert mock_generator.generate_from_notion_export.call_count == 1
         args = mock_generator.generate_from_notion_export.call_args
         assert args[1]["input_folder"] == input_folder
         assert args[1]["output_path"] == output_path
-        assert args[1]["downsample_images"] is True 
\ No newline at end of file
+        assert args[1]["downsample_images"] is True
+    
+    @patch('notion_photobook.core.NotionPhotobookGenerator')
+    def test_create_photobook_reuses_config(self, mock_generator_class, tmp_path):
+        """Test repeated calls with the same layout and paper size share one config."""
+        for _ in range(2):
+            create_photobook(tmp_path, tmp_path / "output.pdf", layout="landscape", paper_size="A5")
+        
+        first, second = (call[0][0] for call in mock_generator_class.call_args_list)
+        assert first is second
+        assert first.paper_size == PaperSize.A5 
\ No newline at end of file
@@ -0,0 +1,193 @@
+"""
+Tests for layout module.
+"""
+
+import os
+
+import pytest
+from PIL import Image
+from reportlab.pdfbase import pdfmetrics
+
+from notion_photobook.config import PhotobookConfig
+from notion_photobook import layout
+from notion_photobook.layout import (
+    ImageLayout, SIZES_SIDECAR, TextLayout, _encode_jpeg_turbo, _fast_size, _turbo_jpeg,
+)
+
+
+def naive_wrap(text, font_name, font_size, max_w):
+    """Reference greedy wrap that measures every candidate line in full."""
+    line, out = "", []
+    for word in text.split():
+        test = f"{line} {word}".strip()
+        if pdfmetrics.stringWidth(test, font_name, font_size) <= max_w:
+            line = test
+        else:
+            out.append(line)
+            line = word
+    if line:
+        out.append(line)
+    return out
+
+
+class TestFastSize:
+    """Test header-only image size reads."""
+    
+    @pytest.mark.parametrize("mode,fmt,options", [
+        ("RGB", "JPEG", {}),
+        ("RGB", "JPEG", {"progressive": True}),
+        ("CMYK", "JPEG", {}),
+        ("RGBA", "PNG", {}),
+        ("P", "PNG", {}),
+    ])
+    def test_matches_pillow(self, tmp_path, mode, fmt, options):
+        """Test sizes read from the header match what Pillow reports."""
+        path = tmp_path / f"photo.{fmt.lower()}"
+        Image.new(mode, (123, 45)).save(path, fmt, **options)
+        
+        with Image.open(path) as im:
+            assert _fast_size(path) == im.size == (123, 45)
+    
+    def test_unsupported_or_broken_files(self, tmp_path):
+        """Test formats that cannot be sized from the header return None."""
+        gif = tmp_path / "photo.gif"
+        Image.new("RGB", (10, 10)).save(gif, "GIF")
+        truncated = tmp_path / "truncated.jpg"
+        truncated.write_bytes(b"\xff\xd8\xff\xe0\x00")
+        
+        assert _fast_size(gif) is None
+        assert _fast_size(truncated) is None
+        assert _fast_size(tmp_path / "missing.jpg") is None
+
+
+class TestImageSizes:
+    """Test the image size sidecar written by downsample_images."""
+    
+    def test_pack_photos_uses_sidecar(self, tmp_path, monkeypatch):
+        """Test packing reads recorded sizes instead of opening unchanged images."""
+        names = [f"photo{idx}.jpg" for idx in range(4)]
+        for name in names:
+            Image.new("RGB", (300, 200)).save(tmp_path / name)
+        ImageLayout(PhotobookConfig()).downsample_images(tmp_path)
+        assert (tmp_path / SIZES_SIDECAR).exists()
+        
+        def fail_open(*args, **kwargs):
+            raise AssertionError("image opened")
+        
+        monkeypatch.setattr(layout.Image, "open", fail_open)
+        slots = ImageLayout(PhotobookConfig()).pack_photos(names, 1000, 1000, 5, tmp_path)
+        
+        assert sorted((s["w"], s["h"]) for s in slots) == [(300, 200)] * 4
+    
+    def test_pack_photos_rereads_changed_images(self, tmp_path):
+        """Test an image rewritten after the sidecar was saved is measured again."""
+        Image.new("RGB", (300, 200)).save(tmp_path / "photo.jpg")
+        image_layout = ImageLayout(PhotobookConfig())
+        image_layout.downsample_images(tmp_path)
+        
+        Image.new("RGB", (100, 400)).save(tmp_path / "photo.jpg")
+        os.utime(tmp_path / "photo.jpg", ns=(0, 0))
+        slots = image_layout.pack_photos(["photo.jpg"], 1000, 1000, 5, tmp_path)
+        
+        assert [(s["w"], s["h"]) for s in slots] == [(100, 400)]
+    
+    @pytest.mark.parametrize("sidecar", [None, b"not json", b"[1, 2, 3]", b'{"photo.jpg": 7}'])
+    def test_pack_photos_without_usable_sidecar(self, tmp_path, sidecar):
+        """Test a missing or corrupt sidecar falls back to reading image headers."""
+        Image.new("RGB", (300, 200)).save(tmp_path / "photo.jpg")
+        if sidecar is not None:
+            (tmp_path / SIZES_SIDECAR).write_bytes(sidecar)
+        
+        slots = ImageLayout(PhotobookConfig()).pack_photos(["photo.jpg"], 1000, 1000, 5, tmp_path)
+        
+        assert [(s["w"], s["h"]) for s in slots] == [(300, 200)]
+
+
+class TestTurboJpeg:
+    """Test JPEG encoding through libjpeg-turbo."""
+    
+    @pytest.fixture(autouse=True)
+    def require_turbojpeg(self):
+        """Skip unless PyTurboJPEG and the libturbojpeg library are both installed."""
+        pytest.importorskip("turbojpeg")
+        if _turbo_jpeg() is None:
+            pytest.skip("libturbojpeg is not available")
+    
+    @pytest.mark.parametrize("mode", ["RGB", "L"])
+    def test_encode_jpeg_turbo(self, tmp_path, mode):
+        """Test RGB and greyscale images are encoded as JPEGs Pillow can read."""
+        path = tmp_path / "photo.jpg"
+        
+        encoded = _encode_jpeg_turbo(Image.new(mode, (64, 32), "white"), quality=90)
+        path.write_bytes(encoded)
+        
+        with Image.open(path) as im:
+            assert (im.format, im.mode, im.size) == ("JPEG", mode, (64, 32))
+    
+    def test_unsupported_mode_falls_back(self):
+        """Test modes libjpeg-turbo is not used for return None."""
+        assert _encode_jpeg_turbo(Image.new("CMYK", (8, 8)), quality=90) is None
+    
+    def test_downsample_uses_turbo(self, tmp_path, monkeypatch):
+        """Test downsampled JPEGs are written by libjpeg-turbo rather than Pillow."""
+        Image.new("RGB", (4000, 2000)).save(tmp_path / "photo.jpg")
+        
+        def fail_save(*args, **kwargs):
+            raise AssertionError("saved with Pillow")
+        
+        monkeypatch.setattr(layout.Image.Image, "save", fail_save)
+        ImageLayout(PhotobookConfig(max_image_long_edge_px=1000)).downsample_images(tmp_path)
+        
+        with Image.open(tmp_path / "photo.jpg") as im:
+            assert im.size == (1000, 500)
+
+
+class TestTextLayout:
+    """Test TextLayout class."""
+    
+    TEXT = (
+        "Woke up early and walked along the harbour before breakfast. "
+        "The café on the corner had fresh croissants again, so naturally "
+        "we stopped for coffee and watched the boats come in."
+    )
+    
+    @pytest.mark.parametrize("max_w", [40, 120, 250, 1000])
+    def test_wrap_matches_full_line_measurement(self, max_w):
+        """Test cached word widths produce the same lines as measuring whole lines."""
+        text_layout = TextLayout(PhotobookConfig())
+        
+        lines = text_layout.wrap_text_to_width(self.TEXT, "Helvetica", 10, max_w)
+        
+        assert lines == naive_wrap(self.TEXT, "Helvetica", 10, max_w)
+    
+    @pytest.mark.parametrize("text,font_name,font_size", [
+        ("WWWWW the the and WWWWW", "Helvetica", 10),
+        ("a a", "Helvetica", 12),
+        ("a mm", "Times-Roman", 10),
+        ("x, a", "Times-Roman", 9),
+    ])
+    def test_wrap_line_exactly_at_width(self, text, font_name, font_size):
+        """Test a line measuring exactly the available width stays on one line."""
+        text_layout = TextLayout(PhotobookConfig())
+        max_w = pdfmetrics.stringWidth(text, font_name, font_size)
+        
+        lines = text_layout.wrap_text_to_width(text, font_name, font_size, max_w)
+        
+        assert lines == naive_wrap(text, font_name, font_size, max_w) == [text]
+    
+    def test_wrap_preserves_paragraphs(self):
+        """Test paragraphs are separated by a blank line."""
+        text_layout = TextLayout(PhotobookConfig())
+        
+        lines = text_layout.wrap_text_to_width("First para.\n\nSecond para.", "Helvetica", 10, 500)
+        
+        assert lines == ["First para.", "", "Second para."]
+    
+    def test_wrap_title(self):
+        """Test title wrapping."""
+        text_layout = TextLayout(PhotobookConfig())
+        
+        assert text_layout.wrap_title("", "Helvetica-Bold", 16, 100) == []
+        assert text_layout.wrap_title(
+            "January 1, 2024 - New Year", "Helvetica-Bold", 16, 1000
+        ) == ["January 1, 2024 - New Year"]
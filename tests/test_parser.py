@@ -0,0 +1,83 @@
+"""
+Tests for parser module.
+"""
+
+import json
+from datetime import datetime
+
+from notion_photobook.parser import NotionParser, _parse_day
+
+
+class TestNotionParser:
+    """Test NotionParser class."""
+    
+    def test_strip_emojis(self, tmp_path):
+        """Test symbols and combining marks are removed, other text kept."""
+        parser = NotionParser(tmp_path)
+        
+        assert parser.strip_emojis("Beach day \U0001F3D6\uFE0F!") == "Beach day !"
+        assert parser.strip_emojis("cafe\u0301 with Zo\u00eb") == "cafe with Zo\u00eb"
+        assert parser.strip_emojis("") == ""
+    
+    def test_parse_day(self):
+        """Test Notion dates parse like strptime("%B %d, %Y")."""
+        assert _parse_day("January 5, 2024") == datetime(2024, 1, 5)
+        assert _parse_day("December 31, 2023") == datetime(2023, 12, 31)
+        assert _parse_day("march 03, 2024") == datetime(2024, 3, 3)  # strptime fallback
+        assert _parse_day("February 30, 2024") == datetime.max
+        assert _parse_day("Someday") == datetime.max
+        assert _parse_day("") == datetime.max
+    
+    def test_save_json(self, tmp_path):
+        """Test records are written as indented UTF-8 JSON without escaping."""
+        records = [{"Title": "Caf\u00e9 \"day\"", "Day": "January 1, 2024", "Text": "a\nb"}]
+        output_path = tmp_path / "entries.json"
+        
+        NotionParser(tmp_path).save_json(records, output_path)
+        
+        assert output_path.read_text(encoding="utf-8") == json.dumps(records, ensure_ascii=False, indent=2)
+    
+    def test_parse_sorts_and_filters_by_date(self, tmp_path):
+        """Test entries come back in date order, with undated entries last."""
+        days = ["March 3, 2024", "not a date", "January 1, 2024", "February 2, 2024"]
+        rows = []
+        for idx, day in enumerate(days):
+            (tmp_path / f"entry{idx}.html").write_text(
+                f'<div class="page-body"><p>Entry {idx}</p></div>', encoding="utf-8"
+            )
+            rows.append(
+                f'<tr><td class="cell-title"><a href="entry{idx}.html">Entry {idx}</a></td>'
+                f'<td class="cell-date">@{day}</td></tr>'
+            )
+        (tmp_path / "Diary.html").write_text(
+            f"<html><body><table>{''.join(rows)}</table></body></html>", encoding="utf-8"
+        )
+        parser = NotionParser(tmp_path)
+        
+        assert [r["Title"] for r in parser.parse()] == [
+            "Entry 2", "Entry 3", "Entry 0", "Entry 1"
+        ]
+        assert [r["Title"] for r in parser.parse(max_date=datetime(2024, 2, 15))] == [
+            "Entry 2", "Entry 3"
+        ]
+    
+    def test_parse_table_entries_prefers_class_order(self, tmp_path):
+        """Test the most preferred cell class wins regardless of column order."""
+        html_file = tmp_path / "Diary.html"
+        html_file.write_text(
+            '<table><tr>'
+            '<td class="date-cell">@Wrong</td>'
+            '<td class="title-cell"><a href="wrong.html">Wrong</a></td>'
+            '<td class="cell-title"><a href="entry.html">Right</a></td>'
+            '<td class="cell-date">@January 1, 2024</td>'
+            '</tr></table>',
+            encoding="utf-8",
+        )
+        
+        entries = NotionParser(tmp_path).parse_table_entries(html_file)
+        
+        assert entries == [{
+            "title": "Right",
+            "date": "January 1, 2024",
+            "filepath": tmp_path / "entry.html",
+        }]
@@ -0,0 +1,173 @@
+"""
+Tests for renderer module.
+"""
+
+import re
+
+import pytest
+from PIL import Image
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
+from reportlab.pdfgen.textobject import PDFTextObject
+
+from notion_photobook.config import PhotobookConfig, Layout
+from notion_photobook.layout import get_image_reader
+from notion_photobook.renderer import PhotobookRenderer, _lines_that_fit
+
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod".split()
+
+
+def long_text(n_words):
+    """Deterministic filler text split into paragraphs."""
+    words = [WORDS[(i * 7) % len(WORDS)] for i in range(n_words)]
+    return "\n\n".join(" ".join(words[i:i + 90]) for i in range(0, n_words, 90))
+
+
+def page_count(pdf_path):
+    """Number of pages in a PDF written by ReportLab."""
+    return len(re.findall(rb"/Type /Page\b(?!s)", pdf_path.read_bytes()))
+
+
+@pytest.fixture
+def recorded_panes(monkeypatch):
+    """Record the (baseline, text) lines of every body text pane drawn, in order."""
+    panes = []
+    set_leading, text_line, draw_text = (
+        PDFTextObject.setLeading, PDFTextObject.textLine, canvas.Canvas.drawText
+    )
+    
+    # Body text objects set a leading; titles and the cover go through drawString
+    def mark_pane(self, leading=None):
+        self.__dict__.setdefault("recorded", [])
+        set_leading(self, leading)
+    
+    def record_line(self, text=""):
+        # textLine draws at the current baseline, then moves the cursor down
+        if "recorded" in self.__dict__:
+            self.recorded.append((self.getY(), text))
+        text_line(self, text)
+    
+    def record_pane(self, text_obj):
+        if "recorded" in text_obj.__dict__:
+            panes.append(text_obj.recorded)
+        draw_text(self, text_obj)
+    
+    monkeypatch.setattr(PDFTextObject, "setLeading", mark_pane)
+    monkeypatch.setattr(PDFTextObject, "textLine", record_line)
+    monkeypatch.setattr(canvas.Canvas, "drawText", record_pane)
+    return panes
+
+
+class TestLinesThatFit:
+    """Test _lines_that_fit helper."""
+    
+    def test_y_on_floor(self):
+        """Test a first baseline exactly text_sz above the margin fits one line."""
+        assert _lines_that_fit(20.0, 12.0, 8.0, 12.0) == 1
+    
+    def test_y_below_floor(self):
+        """Test nothing fits when the first baseline is below the floor."""
+        assert _lines_that_fit(19.9, 12.0, 8.0, 12.0) == 0
+        assert _lines_that_fit(-5.0, 12.0, 8.0, 12.0) == 0
+    
+    @pytest.mark.parametrize("k", [1, 2, 10, 57])
+    def test_exact_multiples_of_leading(self, k):
+        """Test the last line counts when it lands exactly on the floor."""
+        assert _lines_that_fit(20.0 + k * 12.0, 12.0, 8.0, 12.0) == k + 1
+        assert _lines_that_fit(20.0 + k * 12.0 - 0.01, 12.0, 8.0, 12.0) == k
+
+
+class TestCreatePhotobook:
+    """Test PhotobookRenderer.create_photobook end to end."""
+    
+    @pytest.mark.parametrize("layout,text_sz,margin_mm", [
+        (Layout.LANDSCAPE, 10, 5),
+        (Layout.PORTRAIT, 11, 5),
+        (Layout.LANDSCAPE, 6, 3),
+        (Layout.PORTRAIT, 13, 14),
+    ])
+    def test_long_text_fills_panes(self, tmp_path, recorded_panes, layout, text_sz, margin_mm):
+        """Test long text keeps every line, in order, and only breaks panes when one is full."""
+        config = PhotobookConfig(layout=layout, text_font_size=text_sz, margin_mm=margin_mm)
+        renderer = PhotobookRenderer(config)
+        text = long_text(3000)
+        entries = [
+            {"Day": "January 1, 2024", "Title": "Long day", "Photos": "", "Text": text},
+            {"Day": "January 2, 2024", "Title": "Short day", "Photos": "", "Text": "The end."},
+        ]
+        
+        renderer.create_photobook(entries, tmp_path / "book.pdf", tmp_path)
+        
+        page_w, page_h = renderer.layout_engine.get_page_size()
+        margin = margin_mm * mm
+        pane_w, _ = renderer.layout_engine.calculate_pane_dimensions(page_w, page_h, margin)
+        wrapped = renderer.text_layout.wrap_text_to_width(
+            text, config.text_font, text_sz, pane_w - config.image_padding * 2
+        )
+        leading = text_sz * 1.2
+        
+        *long_panes, last_pane = recorded_panes
+        assert len(long_panes) > 2
+        assert [line for pane in long_panes for _, line in pane] == [""] + wrapped
+        assert [line for _, line in last_pane] == ["", "The end."]
+        for pane in long_panes:
+            # The first line of a pane (blank, or the first continuation line) is
+            # always written; every later baseline stays text_sz above the margin
+            assert all(y - margin >= text_sz for y, _ in pane[1:])
+        for pane in long_panes[:-1]:
+            # Panes only break once the next baseline would drop below that limit
+            last_y = pane[-1][0]
+            assert (last_y - leading) - margin < text_sz
+        
+        panes_per_page = 2 if layout == Layout.LANDSCAPE else 1
+        content_pages = -(-len(recorded_panes) // panes_per_page)
+        assert page_count(tmp_path / "book.pdf") == 1 + content_pages  # plus the cover
+    
+    def test_output_is_reproducible(self, tmp_path):
+        """Test rendering the same entries twice gives byte-identical PDFs."""
+        entries = [{"Day": "January 1, 2024", "Title": "Day", "Photos": "", "Text": long_text(200)}]
+        renderer = PhotobookRenderer(PhotobookConfig())
+        
+        renderer.create_photobook(entries, tmp_path / "first.pdf", tmp_path)
+        renderer.create_photobook(entries, tmp_path / "second.pdf", tmp_path)
+        
+        assert (tmp_path / "first.pdf").read_bytes() == (tmp_path / "second.pdf").read_bytes()
+        assert b"/CreationDate (D:20000101000000" in (tmp_path / "first.pdf").read_bytes()
+    
+    def test_background_is_drawn_from_one_form(self, tmp_path):
+        """Test the faded background is embedded once and referenced by every page."""
+        background = tmp_path / "background.png"
+        Image.new("RGB", (40, 30), "red").save(background)
+        config = PhotobookConfig(layout=Layout.PORTRAIT, background_image=background)
+        entries = [{"Day": "January 1, 2024", "Title": "Day", "Photos": "", "Text": long_text(3000)}]
+        
+        PhotobookRenderer(config).create_photobook(entries, tmp_path / "book.pdf", tmp_path)
+        
+        pdf = (tmp_path / "book.pdf").read_bytes()
+        content_pages = page_count(tmp_path / "book.pdf") - 1
+        assert content_pages > 1
+        assert pdf.count(b"/Subtype /Image") == 1
+        assert pdf.count(b"/Subtype /Form") == 1
+        # Content streams are compressed; every content page lists the form as a resource
+        assert pdf.count(b"/FormXob.background ") == content_pages
+    
+    @pytest.mark.parametrize("fail", [False, True])
+    def test_image_readers_are_released(self, tmp_path, monkeypatch, fail):
+        """Test cached image readers are cleared after a book, even if saving fails."""
+        Image.new("RGB", (60, 40), "blue").save(tmp_path / "photo.jpg")
+        entries = [{"Day": "January 1, 2024", "Title": "Day", "Photos": "photo.jpg", "Text": "Hi"}]
+        get_image_reader.cache_clear()
+        renderer = PhotobookRenderer(PhotobookConfig())
+        
+        if fail:
+            def fail_save(self):
+                assert get_image_reader.cache_info().currsize == 1
+                raise OSError("disk full")
+            
+            monkeypatch.setattr(canvas.Canvas, "save", fail_save)
+            with pytest.raises(OSError, match="disk full"):
+                renderer.create_photobook(entries, tmp_path / "book.pdf", tmp_path)
+        else:
+            renderer.create_photobook(entries, tmp_path / "book.pdf", tmp_path)
+        
+        assert get_image_reader.cache_info().currsize == 0